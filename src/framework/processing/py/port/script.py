@@ -72,11 +72,11 @@ def extract_the_data_you_are_interested_in(zip_file: str) -> pd.DataFrame:
     out = pd.DataFrame()
 
     try:
-        file = zipfile.ZipFile(zip_file)
-        data = []
-        for name in file.namelist():
-            info = file.getinfo(name)
-            data.append((name, info.compress_size, info.file_size))
+        with zipfile.ZipFile(zip_file) as file:
+            data = [
+                (info.filename, info.compress_size, info.file_size)
+                for info in file.infolist()
+            ]
 
         out = pd.DataFrame(data, columns=["File name", "Compressed file size", "File size"])
 
@@ -237,17 +237,15 @@ def exit_port(code, info):
 #
 #    try:
 #        file = zipfile.ZipFile(zip_file)
-#        for name in file.namelist():
-#            info = file.getinfo(name)
+#        for info in file.infolist():
 #            count += 1
 #            total_number_of_bytes += info.file_size
 #
 #            # Check if the file is a text file
-#            # if so, open it and count the letter a
-#            if name.endswith('.txt'):
-#                with file.open(name) as txt_file:
-#                    content = txt_file.read().decode('utf-8')
-#                    total_a_count += content.count('a')
+#            # if so, read it and count the letter a
+#            if info.filename.endswith('.txt'):
+#                content = file.read(info).decode('utf-8')
+#                total_a_count += content.count('a')
 #
 #        data = [
 #            ("Total number of files", count),